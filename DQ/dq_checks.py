@@ -3,19 +3,357 @@ import numpy as np
 import os
 import sys
 import itertools
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pandas.api.types import union_categoricals
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pc = pacsv = pq = None
+
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+# Rows per chunk when streaming a table instead of loading it whole
+CHUNK_SIZE = 1_000_000
+
+# Bytes per block when streaming a CSV through Arrow
+CSV_BLOCK_SIZE = 8 << 20
+
+# Range of ID values that can be stored as 32-bit integers
+INT32_MIN, INT32_MAX = np.iinfo(np.int32).min, np.iinfo(np.int32).max
 
 project_path = os.path.abspath(os.path.join('..'))
 
 if project_path not in sys.path:
     sys.path.append(project_path)
 
+
+def _align_categories(left, right, key_columns):
+    """Put categorical keys of both frames on the same categories, so they share one code space"""
+    
+    for col in key_columns:
+        if not (isinstance(left[col].dtype, pd.CategoricalDtype) and 
+                isinstance(right[col].dtype, pd.CategoricalDtype)):
+            continue
+        if left[col].cat.categories.equals(right[col].cat.categories):
+            continue
+        categories = union_categoricals([left[col], right[col]], sort_categories=False).categories
+        left = left.assign(**{col: left[col].cat.set_categories(categories)})
+        right = right.assign(**{col: right[col].cat.set_categories(categories)})
+    
+    return left, right
+
+
+def _rows_below_threshold(table, target_col, th):
+    """Rows of table where target_col < th, filtered through numexpr when it is installed"""
+    
+    threshold = np.float32(th)
+    if ne is not None:
+        # The predicate runs in numexpr's multi-threaded kernels and
+        # pandas selects the rows without a Python-level boolean Series
+        return table.query(f'`{target_col}` < @threshold', engine='numexpr')
+    
+    values = table[target_col].to_numpy(dtype=np.float32, copy=False)
+    return table.iloc[np.flatnonzero(np.less(values, threshold))]
+
+
+def _nullable_dtype(arrow_type):
+    """pandas dtype for an Arrow column: nullable Int64 for integers, the default otherwise"""
+    
+    return pd.Int64Dtype() if pa.types.is_integer(arrow_type) else None
+
+
+def _parse_text_ids(column):
+    """Parse a text ID column the way read_csv would: integers, then floats, else text
+    
+    Floats holding whole numbers (e.g. '101.0', as pandas writes an integer column
+    with gaps) become integers, so they format like any other ID.
+    """
+    
+    try:
+        return pc.cast(column, pa.int64())
+    except pa.ArrowInvalid:
+        pass
+    try:
+        column = pc.cast(column, pa.float64())
+    except pa.ArrowInvalid:
+        # Genuinely non-numeric IDs, which read_csv keeps as text too
+        return column
+    try:
+        return pc.cast(column, pa.int64())
+    except pa.ArrowInvalid:
+        # Fractional values stay floats
+        return column
+
+
+def _filter_batches(batches, target_col, th, text_ids=False):
+    """Rows of Arrow record batches where target_col < th, as a pandas DataFrame
+    
+    With text_ids the other columns were read as strings, and are parsed
+    back into numbers over the surviving rows.
+    """
+    
+    threshold = pa.scalar(th, pa.float32())
+    parts = []
+    for batch in batches:
+        # Compare and gather inside Arrow's compute kernels, batch by batch
+        mask = pc.less(pc.cast(batch.column(target_col), pa.float32()), threshold)
+        parts.append(batch.filter(mask))
+    
+    # Only the surviving rows are converted to pandas
+    bad = pa.Table.from_batches(parts) if parts else None
+    if bad is None or bad.num_rows == 0:
+        return None
+    
+    columns = []
+    for name, column in zip(bad.column_names, bad.columns):
+        if text_ids and name != target_col:
+            column = _parse_text_ids(column)
+        elif pa.types.is_null(column.type):
+            # All-missing columns come out typed null; treat them as empty integer IDs
+            column = column.cast(pa.int64())
+        columns.append(column)
+    bad = pa.table(columns, names=bad.column_names)
+    
+    # Nullable pandas dtypes, so these rows concatenate with the other checks' IDs as numbers
+    return bad.to_pandas(types_mapper=_nullable_dtype).astype({target_col: 'float32'})
+
+
+def _tag_val_range(bad_rows, table_name, target_col, th):
+    """Tag rows that failed the value range check with check metadata"""
+    
+    bad_rows['INPUT_COLUMN'] = target_col
+    bad_rows['INPUT_TABLE'] = table_name
+    bad_rows['INPUT_VALUE'] = th
+    bad_rows['WARNING_TYPE'] = 'val_range'
+    # Build each row's message from its own value in one vectorized pass
+    values = np.char.mod('%.2f', bad_rows[target_col].to_numpy(dtype=np.float32))
+    bad_rows['WARNING'] = np.char.add(np.char.add(f'Value {target_col}=', values),
+                                      f' is below threshold {th} in {table_name}')
+    return bad_rows
+
+
+def _tag_missing_records(missing_records, total_records, table1_name, table2_name, th):
+    """Tag (IDs, dates) missing from table2, or return None if their share is within threshold"""
+    
+    # Calculate what percentage of records are missing
+    missing_count = len(missing_records)
+    missing_pct = (missing_count / total_records * 100) if total_records > 0 else 0
+    if missing_pct <= th:
+        return None
+    
+    missing_records['INPUT_TABLE'] = f'{table1_name} && {table2_name}'
+    missing_records['INPUT_VALUE'] = th
+    missing_records['WARNING_TYPE'] = 'time_cross_consistency'
+    missing_records['WARNING'] = f'{missing_count} records ({missing_pct:.1f}%) from {table1_name} missing in {table2_name}'
+    return missing_records
+
+
+def _integer_key(values):
+    """Key values as (int64 array, missing mask), or None if they aren't integer-coded"""
+    
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        codes = np.asarray(pd.Categorical(values).codes, dtype=np.int64)
+        return codes, codes == -1
+    if pd.api.types.is_integer_dtype(values.dtype):
+        missing = np.asarray(pd.isna(values))
+        return np.asarray(values.to_numpy(dtype=np.int64, na_value=0)), missing
+    return None
+
+
+def _pack_keys(left_keys, right_keys):
+    """Pack integer key columns of both sides into one int64 per row.
+    
+    Each column is shifted to start at 1 (0 marks a missing value) and given just
+    enough bits for its range, so a composite key becomes a single 64-bit number.
+    Returns None when a column isn't integer-coded or the ranges don't fit.
+    """
+    
+    packed_left = np.zeros(len(left_keys[0]), dtype=np.int64)
+    packed_right = np.zeros(len(right_keys[0]), dtype=np.int64)
+    used_bits = 0
+    
+    for left_values, right_values in zip(left_keys, right_keys):
+        # Categorical codes are only comparable when both sides share categories,
+        # and never with plain integers from the other side
+        left_categorical = isinstance(left_values.dtype, pd.CategoricalDtype)
+        right_categorical = isinstance(right_values.dtype, pd.CategoricalDtype)
+        if (left_categorical or right_categorical) and \
+                not (left_categorical and right_categorical and left_values.dtype == right_values.dtype):
+            return None
+        left_key, right_key = _integer_key(left_values), _integer_key(right_values)
+        if left_key is None or right_key is None:
+            return None
+        
+        (left_ints, left_missing), (right_ints, right_missing) = left_key, right_key
+        present = np.concatenate([left_ints[~left_missing], right_ints[~right_missing]])
+        low = int(present.min()) if present.size else 0
+        high = int(present.max()) if present.size else 0
+        bits = (high - low + 1).bit_length()
+        used_bits += bits
+        if used_bits > 63:
+            return None
+        
+        packed_left = (packed_left << bits) | np.where(left_missing, 0, left_ints - low + 1)
+        packed_right = (packed_right << bits) | np.where(right_missing, 0, right_ints - low + 1)
+    
+    return packed_left, packed_right
+
+
+def _missing_keys(packed_left, packed_right):
+    """Mask of packed left keys absent from the right ones, by binary search in the sorted right keys"""
+    
+    right_sorted = np.unique(packed_right)
+    if right_sorted.size == 0:
+        return np.ones(packed_left.size, dtype=bool)
+    
+    pos = np.searchsorted(right_sorted, packed_left)
+    return (pos == right_sorted.size) | \
+        (right_sorted[pos.clip(max=right_sorted.size - 1)] != packed_left)
+
+
+def _anti_join(left, right, key_columns):
+    """Rows of left whose key combination does not appear in right"""
+    
+    left, right = _align_categories(left, right, key_columns)
+    
+    # Integer keys (and categorical codes, now on shared categories):
+    # sort-merge on one packed 64-bit key, no hash table needed
+    packed = _pack_keys([left[col] for col in key_columns], [right[col] for col in key_columns])
+    if packed is not None:
+        return left.iloc[np.flatnonzero(_missing_keys(*packed))].copy()
+    
+    if len(key_columns) == 1:
+        # Single key: plain hash lookup of one column against the other
+        col = key_columns[0]
+        mask = ~left[col].isin(right[col].to_numpy())
+    else:
+        # Composite key: compare whole key tuples
+        left_keys = pd.MultiIndex.from_frame(left[key_columns])
+        right_keys = pd.MultiIndex.from_frame(right[key_columns])
+        mask = ~left_keys.isin(right_keys)
+    
+    return left.loc[mask].copy()
+
+
+def _check_pair(args):
+    """Cross-consistency check for one ordered table pair.
+    
+    Lives at module level so worker processes can run it. Takes the unique keys of
+    both tables as MultiIndexes and returns the orphaned IDs of table1 tagged with
+    check metadata, or the exception if the check failed.
+    """
+    
+    table1_name, table2_name, unique_ids_table1, unique_ids_table2 = args
+    try:
+        # Find IDs in table1 that don't exist in table2 (the orphaned records):
+        # a sorted search on packed keys when they are integers, else a set
+        # difference of the two key indexes
+        packed = _pack_keys([unique_ids_table1.get_level_values(i) for i in range(unique_ids_table1.nlevels)],
+                            [unique_ids_table2.get_level_values(i) for i in range(unique_ids_table2.nlevels)])
+        if packed is not None:
+            orphaned = unique_ids_table1[_missing_keys(*packed)].to_frame(index=False)
+        else:
+            orphaned = unique_ids_table1.difference(unique_ids_table2).to_frame(index=False)
+        
+        if len(orphaned) > 0:
+            # Add metadata for each orphaned record
+            orphaned['INPUT_TABLE'] = f'{table1_name} && {table2_name}'
+            orphaned['WARNING_TYPE'] = 'cross_consistency'
+            orphaned['WARNING'] = f'IDs from {table1_name} not found in {table2_name}'
+        
+        return orphaned
+    
+    except Exception as e:
+        return e
+
+
+def _polars_keys(table1, schema1, table2, schema2, key_columns):
+    """Select key columns of two lazy tables, casting keys whose inferred types differ
+    
+    Polars infers an all-empty CSV column as String, so e.g. a blank CUSTOMER_ID
+    would otherwise fail to join against an integer one.
+    """
+    
+    casts1, casts2 = [], []
+    for col in key_columns:
+        if schema1[col] == schema2[col]:
+            casts1.append(pl.col(col))
+            casts2.append(pl.col(col))
+        elif schema1[col] == pl.String:
+            casts1.append(pl.col(col).cast(schema2[col], strict=False))
+            casts2.append(pl.col(col))
+        elif schema2[col] == pl.String:
+            casts1.append(pl.col(col))
+            casts2.append(pl.col(col).cast(schema1[col], strict=False))
+        else:
+            dtype = pl.Float64 if pl.Float64 in (schema1[col], schema2[col]) else pl.Int64
+            casts1.append(pl.col(col).cast(dtype))
+            casts2.append(pl.col(col).cast(dtype))
+    
+    return table1.select(casts1), table2.select(casts2)
+
+
+def _sql_name(col):
+    """Quote a column name for SQL"""
+    
+    return '"' + col.replace('"', '""') + '"'
+
+
+def _sql_string(value):
+    """Escape a value for use inside a single-quoted SQL string"""
+    
+    return value.replace("'", "''")
+
+
+def _duckdb_keys(schema1, schema2, key_columns):
+    """SELECT lists for the key columns of two tables, casting keys whose inferred types differ
+    
+    read_csv_auto types an all-empty column as VARCHAR, so the VARCHAR side is cast
+    to the other table's type (and unparseable values become NULL).
+    """
+    
+    select1, select2 = [], []
+    for col in key_columns:
+        name = _sql_name(col)
+        if schema1[col] != schema2[col] and schema1[col] == 'VARCHAR':
+            select1.append(f'TRY_CAST({name} AS {schema2[col]}) AS {name}')
+            select2.append(name)
+        elif schema1[col] != schema2[col] and schema2[col] == 'VARCHAR':
+            select1.append(name)
+            select2.append(f'TRY_CAST({name} AS {schema1[col]}) AS {name}')
+        else:
+            select1.append(name)
+            select2.append(name)
+    
+    return ', '.join(select1), ', '.join(select2)
+
+
 class DQ:
     """Main class for running data quality checks on input tables"""
     
     def __init__(self, check_id,
                  check_name, client,
                  input_tables, th_values,
-                 lvl_data, data_path
+                 lvl_data, data_path,
+                 n_jobs=1, backend='pandas'
                 ):
         # Store config parameters
         self.check_id = check_id
@@ -25,118 +363,290 @@ class DQ:
         self.th_values = th_values
         self.lvl_data = lvl_data
         self.data_path = data_path
+        # Worker processes for the cross-consistency pairs (1 = run in-process)
+        self.n_jobs = n_jobs
+        # 'pandas' runs the checks eagerly, 'polars' as one lazy polars plan,
+        # 'duckdb' as SQL queries over the files
+        if backend not in ('pandas', 'polars', 'duckdb'):
+            raise ValueError(f"Unknown backend: {backend}")
+        self.backend = backend
         # This will hold all data quality issues found
         self.data_quality_output = pd.DataFrame()
+        # Issue frames collected by the checks, concatenated once at the end of check()
+        self._output_parts = []
+        self._in_check = False
+        # Running issue counts per warning type and per table, read by get_summary()
+        self._type_counter = Counter()
+        self._table_counter = Counter()
+        # Parsed tables, headers and column sets, so each file is read only once per run
+        self._clear_caches()
         
 
+    def _clear_caches(self):
+        """Forget everything read from the files, so the next run sees their current contents"""
+        
+        # Parsed tables (by name) and headers
+        self._table_cache = {}
+        self._columns_cache = {}
+        # Hierarchy depth per (dimension, hierarchy table), for format_output
+        self._level_counts = {}
+        # Per-table key column sets: all IDs, product/location IDs and dates
+        self._id_cols = {}
+        self._time_id_cols = {}
+        self._date_cols = {}
+    
+    
+    def _parquet_path(self, table_name):
+        """Return the Parquet copy of a table if one exists, else None"""
+        
+        path = self.data_path + table_name + '.parquet'
+        if pq is not None and os.path.exists(path):
+            return path
+        return None
+    
+    
+    def _table_columns(self, table_name):
+        """Get the column names of a table without loading its data"""
+        
+        if table_name not in self._columns_cache:
+            parquet_path = self._parquet_path(table_name)
+            if parquet_path is not None:
+                # Only the footer is read here
+                columns = pq.ParquetFile(parquet_path).schema.names
+            else:
+                columns = pd.read_csv(self.data_path + table_name + '.csv', nrows=0).columns
+            self._columns_cache[table_name] = list(columns)
+        
+        return self._columns_cache[table_name]
+    
+    
+    def _key_columns(self, table_name, columns=None):
+        """ID, product/location ID and date column sets of a table, worked out once per table"""
+        
+        if table_name not in self._id_cols:
+            if columns is None:
+                columns = self._table_columns(table_name)
+            id_cols = frozenset(col for col in columns if 'ID' in col.upper())
+            self._id_cols[table_name] = id_cols
+            self._time_id_cols[table_name] = frozenset(col for col in id_cols 
+                                                       if 'PRODUCT' in col.upper() or 'LOCATION' in col.upper())
+            self._date_cols[table_name] = frozenset(col for col in columns if col.endswith('_DT'))
+        
+        return self._id_cols[table_name], self._time_id_cols[table_name], self._date_cols[table_name]
+    
+    
+    def _load_table(self, table_name, columns=None):
+        """Load a table (or just the needed columns), reusing the parsed copy if already loaded
+        
+        The first load reads every ID and date column along with the requested ones,
+        so the cross and time checks share one parse of each table.
+        """
+        
+        cached = self._table_cache.get(table_name)
+        if cached is None or not set(columns if columns is not None else self._table_columns(table_name)) \
+                .issubset(cached.columns):
+            if columns is None:
+                usecols = None
+            else:
+                id_cols, _, date_cols = self._key_columns(table_name)
+                wanted = id_cols | date_cols | set(columns) | set(cached.columns if cached is not None else ())
+                usecols = [col for col in self._table_columns(table_name) if col in wanted]
+            
+            parquet_path = self._parquet_path(table_name)
+            if parquet_path is not None:
+                # Column pushdown: only the needed columns are read from disk
+                cached = pq.read_table(parquet_path, columns=usecols) \
+                    .to_pandas(types_mapper=_nullable_dtype)
+            else:
+                cached = pd.read_csv(self.data_path + table_name + '.csv', usecols=usecols)
+            self._encode_id_columns(cached)
+            self._table_cache[table_name] = cached
+        
+        return cached if columns is None else cached[list(columns)]
+    
+    
+    def _encode_id_columns(self, table):
+        """Give ID columns integer-coded dtypes so dedup and lookups avoid Python objects"""
+        
+        for col in table.columns:
+            if 'ID' not in col.upper():
+                continue
+            if pd.api.types.is_numeric_dtype(table[col]):
+                # Nullable integers (IDs with gaps are otherwise parsed as float),
+                # 32-bit whenever the values fit
+                try:
+                    ids = table[col].astype('Int64')
+                except (TypeError, ValueError):
+                    continue
+                lo, hi = ids.min(), ids.max()
+                if pd.isna(lo) or (lo >= INT32_MIN and hi <= INT32_MAX):
+                    ids = ids.astype('Int32')
+                table[col] = ids
+            else:
+                table[col] = table[col].astype('category')
+    
+    
+    def _output_id_columns(self, columns, target_col=None):
+        """Hierarchy ID columns (<DIM>_ID for each lvl_data dimension) present in columns"""
+        
+        return [f'{dimension_name}_ID' for dimension_name in self.lvl_data 
+                if f'{dimension_name}_ID' in columns and f'{dimension_name}_ID' != target_col]
+    
+    
+    def _iter_csv_batches(self, table_name, columns, target_col):
+        """Stream a memory-mapped CSV block by block, parsed on Arrow's threads
+        
+        Column types are fixed up front rather than inferred from the first block,
+        where an ID column may still be empty: the target is read as float64 and
+        the ID columns as text (blank cells as missing).
+        """
+        
+        column_types = {col: pa.string() for col in columns}
+        column_types[target_col] = pa.float64()
+        with pa.memory_map(self.data_path + table_name + '.csv') as source:
+            yield from pacsv.open_csv(source,
+                                      read_options=pacsv.ReadOptions(use_threads=True, block_size=CSV_BLOCK_SIZE),
+                                      convert_options=pacsv.ConvertOptions(include_columns=columns, 
+                                                                           column_types=column_types,
+                                                                           strings_can_be_null=True))
+    
+    
+    def _iter_table_chunks(self, table_name, columns, dtype=None):
+        """Stream a CSV table in pandas chunks of CHUNK_SIZE rows (fallback without pyarrow)"""
+        
+        # The pyarrow engine can't chunk, so the C parser is used here
+        yield from pd.read_csv(self.data_path + table_name + '.csv',
+                               usecols=columns, dtype=dtype, chunksize=CHUNK_SIZE)
+    
+    
+    def convert_to_parquet(self, table_names):
+        """One-time conversion of CSV tables to Parquet next to the originals"""
+        
+        if pq is None:
+            raise ImportError("pyarrow is required to write Parquet files")
+        
+        for table_name in table_names:
+            table = pd.read_csv(self.data_path + table_name + '.csv')
+            table.to_parquet(self.data_path + table_name + '.parquet', index=False)
+            print(f"Converted {table_name} to Parquet")
+        
+        # Drop anything parsed from the old CSVs
+        self._clear_caches()
+    
+    
     def check_val_range(self, tables, th=0):
         """Check for values outside acceptable ranges (e.g. negative prices)"""
         
         for table_name, target_col in tables:
             try:
-                # Load the table from CSV
-                table = pd.read_csv(self.data_path + table_name + '.csv')
-                
                 # Skip if the column doesn't exist
-                if target_col not in table.columns:
+                all_columns = self._table_columns(table_name)
+                if target_col not in all_columns:
                     print(f"Warning: Column {target_col} not found in {table_name}")
                     continue
                 
-                # Filter rows where value is below threshold
-                bad_rows = table[table[target_col] < th].copy()
+                # Stream only the target column plus the hierarchy IDs that
+                # format_output needs, keeping just the rows below threshold
+                needed_cols = self._output_id_columns(all_columns, target_col) + [target_col]
+                parquet_path = self._parquet_path(table_name)
+                if parquet_path is not None:
+                    batches = pq.ParquetFile(parquet_path).iter_batches(batch_size=CHUNK_SIZE, columns=needed_cols)
+                    bad_rows = _filter_batches(batches, target_col, th)
+                elif pa is not None:
+                    batches = self._iter_csv_batches(table_name, needed_cols, target_col)
+                    bad_rows = _filter_batches(batches, target_col, th, text_ids=True)
+                else:
+                    parts = []
+                    for chunk in self._iter_table_chunks(table_name, needed_cols, {target_col: 'float32'}):
+                        bad = _rows_below_threshold(chunk, target_col, th)
+                        if len(bad):
+                            parts.append(bad)
+                    bad_rows = pd.concat(parts, ignore_index=True) if parts else None
                 
-                if len(bad_rows) > 0:
-                    # Tag each row with check metadata
-                    bad_rows['INPUT_COLUMN'] = target_col
-                    bad_rows['INPUT_TABLE'] = table_name
-                    bad_rows['INPUT_VALUE'] = th
-                    bad_rows['WARNING_TYPE'] = 'val_range'
-                    bad_rows['WARNING'] = f'Value {target_col}={bad_rows[target_col].iloc[0]:.2f} is below threshold {th} in {table_name}'
-                    
-                    # Append to output
-                    self.data_quality_output = pd.concat([self.data_quality_output, bad_rows], ignore_index=True)
+                if bad_rows is not None:
+                    # Tag each row with check metadata and collect for output
+                    self._add_output(_tag_val_range(bad_rows, table_name, target_col, th))
                     
             except Exception as e:
                 print(f"Error checking {table_name}: {str(e)}")
                 continue
         
-        return self.data_quality_output
+        return self._collect_output()
     
     
     def check_cross_consistency(self, tables):
         """Make sure IDs in one table exist in related tables"""
         
+        # Load the ID columns of every table once, up front
+        loaded = {}
+        for table_name in tables:
+            try:
+                id_cols, _, _ = self._key_columns(table_name)
+                loaded[table_name] = self._load_table(table_name, 
+                                                      [col for col in self._table_columns(table_name) if col in id_cols])
+            except Exception as e:
+                print(f"Error loading {table_name}: {str(e)}")
+        
+        # Unique ID combinations per (table, key columns) as a MultiIndex, shared by all pairs
+        uniques = {}
+        
         # Generate all unique table pairs (A->B and B->A separately)
-        table_pairs = list(itertools.permutations(tables, 2))
+        table_pairs = list(itertools.permutations(loaded, 2))
         
+        pair_args = []
         for table1_name, table2_name in table_pairs:
             try:
-                # Load both tables
-                table1 = pd.read_csv(self.data_path + table1_name + '.csv')
-                table2 = pd.read_csv(self.data_path + table2_name + '.csv')
-                
                 # Find ID columns that exist in both tables
-                all_cols_table1 = set(table1.columns)
-                all_cols_table2 = set(table2.columns)
-                common_id_cols = [col for col in all_cols_table1 & all_cols_table2 
-                                  if 'ID' in col.upper()]
+                common_id_cols = sorted(self._id_cols[table1_name] & self._id_cols[table2_name])
                 
                 # Skip this pair if no common ID columns
                 if not common_id_cols:
                     continue
                 
-                # Get unique ID combinations from each table
-                unique_ids_table1 = table1[common_id_cols].drop_duplicates()
-                unique_ids_table2 = table2[common_id_cols].drop_duplicates()
-                
-                # Find IDs in table1 that don't exist in table2
-                merged = unique_ids_table1.merge(
-                    unique_ids_table2,
-                    on=common_id_cols,
-                    how='left',
-                    indicator=True
-                )
-                
-                # Get the orphaned records
-                orphaned = merged[merged['_merge'] == 'left_only'].copy()
+                # Get unique ID combinations from each table (built only once)
+                for table_name in (table1_name, table2_name):
+                    key = (table_name, tuple(common_id_cols))
+                    if key not in uniques:
+                        uniques[key] = pd.MultiIndex.from_frame(
+                            loaded[table_name][common_id_cols].drop_duplicates())
+                pair_args.append((table1_name, table2_name,
+                                  uniques[(table1_name, tuple(common_id_cols))],
+                                  uniques[(table2_name, tuple(common_id_cols))]))
                 
-                if len(orphaned) > 0:
-                    # Drop the merge indicator column
-                    orphaned = orphaned.drop('_merge', axis=1)
-                    
-                    # Add metadata for each orphaned record
-                    orphaned['INPUT_TABLE'] = f'{table1_name} && {table2_name}'
-                    orphaned['WARNING_TYPE'] = 'cross_consistency'
-                    orphaned['WARNING'] = f'IDs from {table1_name} not found in {table2_name}'
-                    
-                    # Append to output
-                    self.data_quality_output = pd.concat([self.data_quality_output, orphaned], ignore_index=True)
-                    
             except Exception as e:
                 print(f"Error checking {table1_name} vs {table2_name}: {str(e)}")
                 continue
         
-        return self.data_quality_output
+        # Pairs are independent, so they can be spread over worker processes
+        if self.n_jobs > 1 and len(pair_args) > 1:
+            with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+                results = list(executor.map(_check_pair, pair_args))
+        else:
+            results = map(_check_pair, pair_args)
+        
+        for (table1_name, table2_name, *_), orphaned in zip(pair_args, results):
+            if isinstance(orphaned, Exception):
+                print(f"Error checking {table1_name} vs {table2_name}: {str(orphaned)}")
+            elif len(orphaned) > 0:
+                # Collect for output
+                self._add_output(orphaned)
+        
+        return self._collect_output()
+    
     
     def check_time_cross_consistency(self, tables, th):
         """Check if product-location pairs exist across time periods in related tables"""
         
         for table1_name, table2_name in tables:
             try:
-                # Load both tables
-                table1 = pd.read_csv(self.data_path + table1_name + '.csv')
-                table2 = pd.read_csv(self.data_path + table2_name + '.csv')
+                _, time_ids1, dates1 = self._key_columns(table1_name)
+                _, time_ids2, dates2 = self._key_columns(table2_name)
                 
-                # Find common columns between tables
-                common_columns = set(table1.columns) & set(table2.columns)
+                # ID columns (PRODUCT_ID, LOCATION_ID) common to both tables
+                id_columns = sorted(time_ids1 & time_ids2)
                 
-                # Extract ID columns (PRODUCT_ID, LOCATION_ID)
-                id_columns = [col for col in common_columns 
-                             if 'ID' in col.upper() and 
-                             ('PRODUCT' in col.upper() or 'LOCATION' in col.upper())]
-                
-                # Extract date columns (any column ending with _DT)
-                date_columns = [col for col in common_columns if col.endswith('_DT')]
+                # Date columns (any column ending with _DT) common to both tables
+                date_columns = sorted(dates1 & dates2)
                 
                 # Need both IDs and dates for this check
                 if not id_columns or not date_columns:
@@ -145,63 +655,55 @@ class DQ:
                 # Combine for composite key
                 key_columns = id_columns + date_columns
                 
-                # Get unique combinations from each table
-                unique_keys_table1 = table1[key_columns].drop_duplicates()
+                # Load only the key columns of both tables
+                table1 = self._load_table(table1_name, key_columns)
+                table2 = self._load_table(table2_name, key_columns)
+                
+                # Get unique combinations from each table. This is the only scan
+                # of table1: both checks below are derived from its unique pairs
+                pairs = table1[key_columns].drop_duplicates()
                 unique_keys_table2 = table2[key_columns].drop_duplicates()
                 
                 # Find combinations in table1 missing from table2
-                merged = unique_keys_table1.merge(
-                    unique_keys_table2,
-                    on=key_columns,
-                    how='left',
-                    indicator=True
-                )
-                
-                missing_records = merged[merged['_merge'] == 'left_only'].copy()
+                missing_records = _anti_join(pairs, unique_keys_table2, key_columns)
                 
                 if len(missing_records) > 0:
-                    # Drop merge indicator
-                    missing_records = missing_records.drop('_merge', axis=1)
-                    
-                    # Calculate what percentage of records are missing
-                    total_records = len(unique_keys_table1)
-                    missing_count = len(missing_records)
-                    missing_pct = (missing_count / total_records * 100) if total_records > 0 else 0
-                    
-                    # Add metadata
-                    missing_records['INPUT_TABLE'] = f'{table1_name} && {table2_name}'
-                    missing_records['INPUT_VALUE'] = th
-                    missing_records['WARNING_TYPE'] = 'time_cross_consistency'
-                    missing_records['WARNING'] = f'{missing_count} records ({missing_pct:.1f}%) from {table1_name} missing in {table2_name}'
-                    
                     # Only add if missing percentage exceeds threshold
-                    if missing_pct > th:
-                        self.data_quality_output = pd.concat([self.data_quality_output, missing_records], ignore_index=True)
+                    missing_records = _tag_missing_records(missing_records, len(pairs),
+                                                           table1_name, table2_name, th)
+                    if missing_records is not None:
+                        self._add_output(missing_records)
                 
                 # Also check for infrequent occurrences
                 # Group by ID columns only (without date) to see frequency over time
                 if len(id_columns) > 0:
-                    # Count how many date periods each ID combo appears in table1
-                    id_date_counts = table1.groupby(id_columns)[date_columns[0]].nunique().reset_index()
-                    id_date_counts.columns = id_columns + ['period_count']
+                    # Count how many date periods each ID combo appears in table1.
+                    # The pairs are already unique, so with a single date column
+                    # the non-missing dates per ID combo are its distinct periods
+                    # (an ID seen only with missing dates counts 0 periods)
+                    period_pairs = pairs[id_columns + [date_columns[0]]]
+                    if len(date_columns) > 1:
+                        period_pairs = period_pairs.drop_duplicates()
+                    id_date_counts = period_pairs.groupby(id_columns, sort=False, observed=True)[date_columns[0]] \
+                        .count().reset_index(name='period_count')
                     
-                    # Find IDs that appear in very few periods (below threshold)
-                    infrequent = id_date_counts[id_date_counts['period_count'] <= th].copy()
+                    # Find IDs that appear in very few periods (below threshold),
+                    # keeping only the ID columns
+                    infrequent = id_date_counts.loc[id_date_counts['period_count'] <= th, id_columns].copy()
                     
                     if len(infrequent) > 0:
-                        infrequent = infrequent.drop('period_count', axis=1)
                         infrequent['INPUT_TABLE'] = f'{table1_name}'
                         infrequent['INPUT_VALUE'] = th
                         infrequent['WARNING_TYPE'] = 'time_cross_consistency'
                         infrequent['WARNING'] = f'ID appears in {th} or fewer time periods in {table1_name}'
                         
-                        self.data_quality_output = pd.concat([self.data_quality_output, infrequent], ignore_index=True)
+                        self._add_output(infrequent)
                         
             except Exception as e:
                 print(f"Error in time consistency check for {table1_name} vs {table2_name}: {str(e)}")
                 continue
         
-        return self.data_quality_output
+        return self._collect_output()
     
     
     def format_output(self, lvl_data):
@@ -210,7 +712,9 @@ class DQ:
         if self.data_quality_output.empty:
             return
         
-        # Process each dimension (LOCATION, PRODUCT, CUSTOMER, DISTR_CHANNEL)
+        # Build the level columns of each dimension (LOCATION, PRODUCT, CUSTOMER, DISTR_CHANNEL)
+        level_columns = {}
+        id_columns = []
         for dimension_name, hierarchy_table_name in lvl_data.items():
             id_col_name = f'{dimension_name}_ID'
             
@@ -219,31 +723,59 @@ class DQ:
                 continue
             
             try:
-                # Load the hierarchy table to understand structure
-                hierarchy_table = pd.read_csv(self.data_path + hierarchy_table_name + '.csv')
-                
-                # Count how many levels exist (e.g., PRODUCT_LVL_ID1, PRODUCT_LVL_ID2, etc.)
-                level_cols = [col for col in hierarchy_table.columns if f'{dimension_name}_LVL_ID' in col]
-                num_levels = len(level_cols)
-                
                 # The ID column represents the lowest (most detailed) level
                 # So if we have 5 levels, this ID is level 6
-                target_level = num_levels + 1
-                
-                # Create the properly named level column
-                self.data_quality_output[f'{dimension_name}_LVL_ID{target_level}'] = \
-                    self.data_quality_output[id_col_name].astype('Int64')
+                target_level = self._level_count(dimension_name, hierarchy_table_name) + 1
+                level_ids = self.data_quality_output[id_col_name].astype('Int64')
                 
-                # Store which level this represents
-                self.data_quality_output[f'{dimension_name}_LVL'] = target_level
-                
-                # Drop the original ID column (we've renamed it)
-                self.data_quality_output = self.data_quality_output.drop(id_col_name, axis=1)
+                level_columns[f'{dimension_name}_LVL_ID{target_level}'] = level_ids
+                level_columns[f'{dimension_name}_LVL'] = target_level
+                id_columns.append(id_col_name)
                 
             except Exception as e:
                 print(f"Warning: Could not format {dimension_name}: {str(e)}")
                 continue
-            
+        
+        # Swap every ID column for its level columns in one pass
+        self.data_quality_output = self.data_quality_output \
+            .drop(columns=id_columns) \
+            .assign(**level_columns)
+    
+    
+    def _level_count(self, dimension_name, hierarchy_table_name):
+        """Number of <DIM>_LVL_ID columns in a hierarchy table, read from its header once"""
+        
+        key = (dimension_name, hierarchy_table_name)
+        if key not in self._level_counts:
+            # Count how many levels exist (e.g., PRODUCT_LVL_ID1, PRODUCT_LVL_ID2, etc.)
+            self._level_counts[key] = sum(1 for col in self._table_columns(hierarchy_table_name) 
+                                          if f'{dimension_name}_LVL_ID' in col)
+        return self._level_counts[key]
+    
+    
+    def _collect_output(self):
+        """Concatenate pending issue frames into data_quality_output and return it
+        
+        Inside check() this waits for the end of the run, so everything is combined
+        in a single concat; check methods called on their own fold in right away.
+        """
+        
+        if self._output_parts and not self._in_check:
+            parts = [self.data_quality_output] if not self.data_quality_output.empty else []
+            self.data_quality_output = pd.concat(parts + self._output_parts, ignore_index=True)
+            self._output_parts = []
+        return self.data_quality_output
+    
+    
+    def _add_output(self, part):
+        """Collect an issue frame for output and count its rows by warning type and table"""
+        
+        self._output_parts.append(part)
+        if len(part) > 0:
+            # Each frame comes from one check on one table (or pair), so its first row labels all of it
+            self._type_counter[part['WARNING_TYPE'].iat[0]] += len(part)
+            self._table_counter[part['INPUT_TABLE'].iat[0]] += len(part)
+    
     
     def check(self):
         """Run all data quality checks in sequence"""
@@ -251,47 +783,355 @@ class DQ:
         print(f"Starting data quality checks for: {self.check_name}")
         print("=" * 60)
         
-        # Reset output to start fresh
+        # Reset output to start fresh, and re-read files that may have changed since the last run
         self.data_quality_output = pd.DataFrame()
+        self._output_parts = []
+        self._type_counter = Counter()
+        self._table_counter = Counter()
+        self._clear_caches()
+        
+        self._in_check = True
+        try:
+            if self.backend == 'polars':
+                self._check_polars()
+            elif self.backend == 'duckdb':
+                self._check_duckdb()
+            else:
+                self._check_pandas()
+        finally:
+            self._in_check = False
+        
+        # Combine everything found in a single concat
+        self._collect_output()
+        
+        # STEP 4: Format the output to match expected structure
+        print("\n[4/4] Formatting output...")
+        self.format_output(self.lvl_data)
+        
+        print(f"\n{'='*60}")
+        print(f"COMPLETE: Found {len(self.data_quality_output)} total issues")
+        print(f"{'='*60}\n")
+    
+    
+    def _check_pandas(self):
+        """Run checks 1-3 eagerly with pandas, one after another"""
         
         # STEP 1: Check for invalid values (negative prices, quantities, etc.)
         print("\n[1/3] Checking value ranges...")
         if 'val_range' in self.input_tables and 'val_range' in self.th_values:
-            initial_count = len(self.data_quality_output)
+            initial_parts = len(self._output_parts)
             self.check_val_range(
                 self.input_tables['val_range'],
                 self.th_values['val_range']
             )
-            found = len(self.data_quality_output) - initial_count
+            found = sum(len(part) for part in self._output_parts[initial_parts:])
             print(f"      Found {found} value range issues")
         
         # STEP 2: Check that IDs exist across related tables
         print("\n[2/3] Checking cross-table consistency...")
         if 'cross_consistency' in self.input_tables:
-            initial_count = len(self.data_quality_output)
+            initial_parts = len(self._output_parts)
             self.check_cross_consistency(self.input_tables['cross_consistency'])
-            found = len(self.data_quality_output) - initial_count
+            found = sum(len(part) for part in self._output_parts[initial_parts:])
             print(f"      Found {found} cross-consistency issues")
         
         # STEP 3: Check temporal consistency (same IDs across time periods)
         print("\n[3/3] Checking time-based consistency...")
         if 'time_cross_consistency' in self.input_tables and 'time_cross_consistency' in self.th_values:
-            initial_count = len(self.data_quality_output)
+            initial_parts = len(self._output_parts)
             self.check_time_cross_consistency(
                 self.input_tables['time_cross_consistency'],
                 self.th_values['time_cross_consistency']
             )
-            found = len(self.data_quality_output) - initial_count
+            found = sum(len(part) for part in self._output_parts[initial_parts:])
             print(f"      Found {found} time-consistency issues")
+    
+    
+    def _scan_table(self, table_name):
+        """Lazily scan a table with polars (Parquet copy if present, else CSV)"""
         
-        # STEP 4: Format the output to match expected structure
-        print("\n[4/4] Formatting output...")
-        self.format_output(self.lvl_data)
+        parquet_path = self.data_path + table_name + '.parquet'
+        if os.path.exists(parquet_path):
+            return pl.scan_parquet(parquet_path)
+        return pl.scan_csv(self.data_path + table_name + '.csv')
+    
+    
+    def _check_polars(self):
+        """Build checks 1-3 as polars lazy queries and collect them all at once"""
         
-        print(f"\n{'='*60}")
-        print(f"COMPLETE: Found {len(self.data_quality_output)} total issues")
-        print(f"{'='*60}\n")
+        if pl is None:
+            raise ImportError("polars is required for backend='polars'")
+        
+        # Each job is (warning type, metadata, lazy frames); nothing runs until collect_all
+        jobs = []
+        
+        # STEP 1: Check for invalid values (negative prices, quantities, etc.)
+        print("\n[1-3/3] Planning value range, cross-table and time-based checks...")
+        if 'val_range' in self.input_tables and 'val_range' in self.th_values:
+            th = self.th_values['val_range']
+            for table_name, target_col in self.input_tables['val_range']:
+                try:
+                    table = self._scan_table(table_name)
+                    columns = table.collect_schema().names()
+                    if target_col not in columns:
+                        print(f"Warning: Column {target_col} not found in {table_name}")
+                        continue
+                    
+                    needed_cols = self._output_id_columns(columns, target_col) + [target_col]
+                    bad_rows = table.select(needed_cols) \
+                        .with_columns(pl.col(target_col).cast(pl.Float32)) \
+                        .filter(pl.col(target_col) < th)
+                    jobs.append(('val_range', (table_name, target_col, th), [bad_rows]))
+                    
+                except Exception as e:
+                    print(f"Error checking {table_name}: {str(e)}")
+                    continue
         
+        # STEP 2: Check that IDs exist across related tables
+        if 'cross_consistency' in self.input_tables:
+            scans = {}
+            for table_name in self.input_tables['cross_consistency']:
+                try:
+                    table = self._scan_table(table_name)
+                    scans[table_name] = (table, table.collect_schema())
+                except Exception as e:
+                    print(f"Error loading {table_name}: {str(e)}")
+            
+            for table1_name, table2_name in itertools.permutations(scans, 2):
+                (table1, schema1), (table2, schema2) = scans[table1_name], scans[table2_name]
+                common_id_cols = sorted(self._key_columns(table1_name, schema1)[0] & 
+                                        self._key_columns(table2_name, schema2)[0])
+                if not common_id_cols:
+                    continue
+                
+                keys1, keys2 = _polars_keys(table1, schema1, table2, schema2, common_id_cols)
+                orphaned = keys1.unique() \
+                    .join(keys2.unique(), on=common_id_cols, how='anti', nulls_equal=True) \
+                    .with_columns(pl.lit(f'{table1_name} && {table2_name}').alias('INPUT_TABLE'),
+                                  pl.lit('cross_consistency').alias('WARNING_TYPE'),
+                                  pl.lit(f'IDs from {table1_name} not found in {table2_name}').alias('WARNING'))
+                jobs.append(('cross_consistency', (table1_name, table2_name), [orphaned]))
+        
+        # STEP 3: Check temporal consistency (same IDs across time periods)
+        if 'time_cross_consistency' in self.input_tables and 'time_cross_consistency' in self.th_values:
+            th = self.th_values['time_cross_consistency']
+            for table1_name, table2_name in self.input_tables['time_cross_consistency']:
+                try:
+                    table1, table2 = self._scan_table(table1_name), self._scan_table(table2_name)
+                    schema1, schema2 = table1.collect_schema(), table2.collect_schema()
+                    _, time_ids1, dates1 = self._key_columns(table1_name, schema1)
+                    _, time_ids2, dates2 = self._key_columns(table2_name, schema2)
+                    id_columns = sorted(time_ids1 & time_ids2)
+                    date_columns = sorted(dates1 & dates2)
+                    if not id_columns or not date_columns:
+                        continue
+                    key_columns = id_columns + date_columns
+                    
+                    keys1, keys2 = _polars_keys(table1, schema1, table2, schema2, key_columns)
+                    pairs = keys1.unique()
+                    missing_records = pairs.join(keys2.unique(), on=key_columns, how='anti', nulls_equal=True)
+                    
+                    # Distinct non-missing dates per ID combo, skipping missing IDs like pandas
+                    # groupby does; an ID seen only with missing dates counts 0 periods
+                    infrequent = pairs.drop_nulls(id_columns).group_by(id_columns) \
+                        .agg(pl.col(date_columns[0]).drop_nulls().n_unique().alias('period_count')) \
+                        .filter(pl.col('period_count') <= th).drop('period_count') \
+                        .with_columns(pl.lit(table1_name).alias('INPUT_TABLE'),
+                                      pl.lit(th).alias('INPUT_VALUE'),
+                                      pl.lit('time_cross_consistency').alias('WARNING_TYPE'),
+                                      pl.lit(f'ID appears in {th} or fewer time periods in {table1_name}').alias('WARNING'))
+                    jobs.append(('time_cross_consistency', (table1_name, table2_name, th),
+                                 [missing_records, pairs.select(pl.len()), infrequent]))
+                    
+                except Exception as e:
+                    print(f"Error in time consistency check for {table1_name} vs {table2_name}: {str(e)}")
+                    continue
+        
+        # Run every query in one go, so polars can share scans between them
+        queries = [query for _, _, lazy_frames in jobs for query in lazy_frames]
+        try:
+            results = pl.collect_all(queries)
+        except Exception:
+            # Collect one query at a time so the failing check can be reported
+            results = []
+            for query in queries:
+                try:
+                    results.append(query.collect())
+                except Exception as e:
+                    results.append(e)
+        
+        found = {'val_range': 0, 'cross_consistency': 0, 'time_cross_consistency': 0}
+        position = 0
+        for warning_type, meta, lazy_frames in jobs:
+            frames = results[position:position + len(lazy_frames)]
+            position += len(lazy_frames)
+            errors = [frame for frame in frames if isinstance(frame, Exception)]
+            if errors:
+                print(f"Error in {warning_type} check for {' vs '.join(map(str, meta[:2]))}: {str(errors[0])}")
+                continue
+            
+            if warning_type == 'val_range':
+                table_name, target_col, th = meta
+                parts = [_tag_val_range(frames[0].to_pandas(), table_name, target_col, th)]
+            elif warning_type == 'cross_consistency':
+                parts = [frames[0].to_pandas()]
+            else:
+                table1_name, table2_name, th = meta
+                missing_records, total_records, infrequent = frames
+                parts = [_tag_missing_records(missing_records.to_pandas(), total_records.item(),
+                                              table1_name, table2_name, th) 
+                         if len(missing_records) > 0 else None,
+                         infrequent.to_pandas()]
+            
+            for part in parts:
+                if part is not None and len(part) > 0:
+                    found[warning_type] += len(part)
+                    self._add_output(part)
+        
+        print(f"      Found {found['val_range']} value range issues")
+        print(f"      Found {found['cross_consistency']} cross-consistency issues")
+        print(f"      Found {found['time_cross_consistency']} time-consistency issues")
+    
+    
+    def _duckdb_source(self, table_name):
+        """SQL table function reading a table's Parquet copy if present, else its CSV"""
+        
+        parquet_path = self.data_path + table_name + '.parquet'
+        if os.path.exists(parquet_path):
+            return f"read_parquet('{_sql_string(parquet_path)}')"
+        # No date/time candidates: dates stay text, as read_csv and polars leave them
+        return (f"read_csv_auto('{_sql_string(self.data_path + table_name + '.csv')}', "
+                f"auto_type_candidates=['BOOLEAN', 'BIGINT', 'DOUBLE', 'VARCHAR'])")
+    
+    
+    def _check_duckdb(self):
+        """Run checks 1-3 as DuckDB SQL, which scans only the needed columns, multi-threaded"""
+        
+        if duckdb is None:
+            raise ImportError("duckdb is required for backend='duckdb'")
+        
+        con = duckdb.connect()
+        schemas = {}
+        
+        def schema(table_name):
+            # Column name -> type, read from the file header/footer only
+            if table_name not in schemas:
+                rows = con.execute(f"DESCRIBE SELECT * FROM {self._duckdb_source(table_name)}").fetchall()
+                schemas[table_name] = {row[0]: row[1] for row in rows}
+            return schemas[table_name]
+        
+        # STEP 1: Check for invalid values (negative prices, quantities, etc.)
+        print("\n[1/3] Checking value ranges...")
+        if 'val_range' in self.input_tables and 'val_range' in self.th_values:
+            th = self.th_values['val_range']
+            found = 0
+            for table_name, target_col in self.input_tables['val_range']:
+                try:
+                    columns = schema(table_name)
+                    if target_col not in columns:
+                        print(f"Warning: Column {target_col} not found in {table_name}")
+                        continue
+                    
+                    id_cols = [_sql_name(col) for col in self._output_id_columns(columns, target_col)]
+                    target = _sql_name(target_col)
+                    bad_rows = con.execute(
+                        f"SELECT {', '.join(id_cols + [f'CAST({target} AS FLOAT) AS {target}'])} "
+                        f"FROM {self._duckdb_source(table_name)} WHERE {target} < ?", [th]).df()
+                    
+                    if len(bad_rows) > 0:
+                        found += len(bad_rows)
+                        self._add_output(_tag_val_range(bad_rows, table_name, target_col, th))
+                    
+                except Exception as e:
+                    print(f"Error checking {table_name}: {str(e)}")
+                    continue
+            print(f"      Found {found} value range issues")
+        
+        # STEP 2: Check that IDs exist across related tables
+        print("\n[2/3] Checking cross-table consistency...")
+        if 'cross_consistency' in self.input_tables:
+            found = 0
+            for table1_name, table2_name in itertools.permutations(self.input_tables['cross_consistency'], 2):
+                try:
+                    schema1, schema2 = schema(table1_name), schema(table2_name)
+                    common_id_cols = sorted(self._key_columns(table1_name, schema1)[0] & 
+                                            self._key_columns(table2_name, schema2)[0])
+                    if not common_id_cols:
+                        continue
+                    
+                    # EXCEPT treats NULLs as equal, like the pandas merge did
+                    keys1, keys2 = _duckdb_keys(schema1, schema2, common_id_cols)
+                    orphaned = con.execute(
+                        f"SELECT {keys1} FROM {self._duckdb_source(table1_name)} "
+                        f"EXCEPT SELECT {keys2} FROM {self._duckdb_source(table2_name)}").df()
+                    
+                    if len(orphaned) > 0:
+                        orphaned['INPUT_TABLE'] = f'{table1_name} && {table2_name}'
+                        orphaned['WARNING_TYPE'] = 'cross_consistency'
+                        orphaned['WARNING'] = f'IDs from {table1_name} not found in {table2_name}'
+                        found += len(orphaned)
+                        self._add_output(orphaned)
+                    
+                except Exception as e:
+                    print(f"Error checking {table1_name} vs {table2_name}: {str(e)}")
+                    continue
+            print(f"      Found {found} cross-consistency issues")
+        
+        # STEP 3: Check temporal consistency (same IDs across time periods)
+        print("\n[3/3] Checking time-based consistency...")
+        if 'time_cross_consistency' in self.input_tables and 'time_cross_consistency' in self.th_values:
+            th = self.th_values['time_cross_consistency']
+            found = 0
+            for table1_name, table2_name in self.input_tables['time_cross_consistency']:
+                try:
+                    schema1, schema2 = schema(table1_name), schema(table2_name)
+                    _, time_ids1, dates1 = self._key_columns(table1_name, schema1)
+                    _, time_ids2, dates2 = self._key_columns(table2_name, schema2)
+                    id_columns = sorted(time_ids1 & time_ids2)
+                    date_columns = sorted(dates1 & dates2)
+                    if not id_columns or not date_columns:
+                        continue
+                    key_columns = id_columns + date_columns
+                    
+                    # Unique (IDs, dates) of table1, scanned once and reused by both checks
+                    keys1, keys2 = _duckdb_keys(schema1, schema2, key_columns)
+                    con.execute(f"CREATE OR REPLACE TEMP TABLE pairs AS "
+                                f"SELECT DISTINCT {keys1} FROM {self._duckdb_source(table1_name)}")
+                    missing_records = con.execute(
+                        f"SELECT * FROM pairs EXCEPT SELECT {keys2} FROM {self._duckdb_source(table2_name)}").df()
+                    
+                    if len(missing_records) > 0:
+                        total_records = con.execute("SELECT COUNT(*) FROM pairs").fetchone()[0]
+                        missing_records = _tag_missing_records(missing_records, total_records,
+                                                               table1_name, table2_name, th)
+                        if missing_records is not None:
+                            found += len(missing_records)
+                            self._add_output(missing_records)
+                    
+                    # Periods per ID combo, skipping missing IDs like pandas groupby does.
+                    # COUNT(DISTINCT) ignores missing dates, so an ID seen only with them counts 0
+                    ids = ', '.join(_sql_name(col) for col in id_columns)
+                    not_null = ' AND '.join(f'{_sql_name(col)} IS NOT NULL' for col in id_columns)
+                    infrequent = con.execute(
+                        f"SELECT {ids} FROM pairs WHERE {not_null} GROUP BY {ids} "
+                        f"HAVING COUNT(DISTINCT {_sql_name(date_columns[0])}) <= ?", [th]).df()
+                    
+                    if len(infrequent) > 0:
+                        infrequent['INPUT_TABLE'] = f'{table1_name}'
+                        infrequent['INPUT_VALUE'] = th
+                        infrequent['WARNING_TYPE'] = 'time_cross_consistency'
+                        infrequent['WARNING'] = f'ID appears in {th} or fewer time periods in {table1_name}'
+                        found += len(infrequent)
+                        self._add_output(infrequent)
+                    
+                except Exception as e:
+                    print(f"Error in time consistency check for {table1_name} vs {table2_name}: {str(e)}")
+                    continue
+            print(f"      Found {found} time-consistency issues")
+        
+        con.close()
+    
+    
     def get_summary(self):
         """Get a summary of data quality issues found"""
         
@@ -311,13 +1151,9 @@ class DQ:
             'severity': 'LOW'
         }
         
-        # Break down issues by type
-        if 'WARNING_TYPE' in self.data_quality_output.columns:
-            summary['by_type'] = self.data_quality_output['WARNING_TYPE'].value_counts().to_dict()
-        
-        # Break down issues by table
-        if 'INPUT_TABLE' in self.data_quality_output.columns:
-            summary['by_table'] = self.data_quality_output['INPUT_TABLE'].value_counts().to_dict()
+        # Break down issues by type and by table, from the counts kept during check()
+        summary['by_type'] = dict(self._type_counter.most_common())
+        summary['by_table'] = dict(self._table_counter.most_common())
         
         # Assign severity based on issue count
         total = summary['total_issues']